@@ -1,9 +1,13 @@
-import yaml
+import io
+import json
 import os
 import sys
 import re
+import shutil
 
 ITEMS_FILE = "pb.yaml"
+# JSON snapshot of ITEMS_FILE; much faster to load than re-parsing YAML
+CACHE_FILE = ITEMS_FILE + ".json"
 
 # --- Color support (TTY-only; honors NO_COLOR and PB_COLOR=0) ---
 
@@ -37,14 +41,31 @@ def fmt(text: str, *styles: str) -> str:
     return "".join(styles) + text + RESET
 
 
+# Shortcuts for the most common style combinations (headers and keys)
+_S_BM = BOLD + MAGENTA
+_S_BC = BOLD + CYAN
+
+
+def _bm(text: str) -> str:
+    return _S_BM + text + RESET if _COLOR_ON else text
+
+
+def _bc(text: str) -> str:
+    return _S_BC + text + RESET if _COLOR_ON else text
+
+
+# ANSI clear screen and move cursor to home
+_CLS = "\033[2J\033[H"
+
+
 def clear_screen():
     """Clear terminal screen on macOS/Linux/Windows."""
     try:
         if os.name == "nt":
             os.system("cls")
         else:
-            # ANSI clear screen and move cursor to home
-            print("\033[2J\033[H", end="")
+            sys.stdout.write(_CLS)
+            sys.stdout.flush()
     except Exception:
         # Fallback: some newlines
         print("\n" * 5)
@@ -59,7 +80,44 @@ def wait_for_enter():
         pass
 
 
-def colorize_yaml(yaml_text: str) -> str:
+# Precomputed list-marker prefix for colorize_yaml
+_DASH = CYAN + "- " + RESET
+
+# One pass per line: comment | list item | key/value (tried in that order)
+_LINE_RE = re.compile(
+    r"^(?:(?P<comment>\s*#.*)"
+    r"|(?P<dindent>\s*)-\s+(?P<dval>.*)"
+    r"|(?P<kindent>\s*)(?P<key>[^:\n]+?)(?P<colon>:)(?P<kspace>\s*)(?P<kval>.*))$"
+)
+_NUM_RE = re.compile(r"[+-]?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?")
+_NUM_START = frozenset("+-0123456789.")
+# Lowercased null and boolean words, colored magenta
+_MAGENTA_WORDS = frozenset({
+    "~", "null", "nil", "none",
+    "true", "false", "yes", "no", "on", "off",
+})
+
+
+def _color_value(v: str) -> str:
+    sv = v.strip()
+    # punctuation
+    if sv in ("[]", "{}"):
+        return f"{MAGENTA}{v}{RESET}"
+    # nulls and booleans (longest word is "false")
+    if len(sv) <= 5 and sv.lower() in _MAGENTA_WORDS:
+        return f"{MAGENTA}{v}{RESET}"
+    # numbers (int/float/scientific); cheap first-char check before regex
+    if sv and sv[0] in _NUM_START and _NUM_RE.fullmatch(sv):
+        return f"{YELLOW}{v}{RESET}"
+    # quoted and unquoted scalars as strings
+    return f"{GREEN}{v}{RESET}"
+
+
+# Lines per write in write_colored_yaml
+_WRITE_CHUNK = 128
+
+
+def write_colored_yaml(yaml_text: str, out=None) -> None:
     """Minimal YAML colorization for terminal (common YAML conventions).
     - Top-level keys: bold magenta (main elements)
     - Keys (nested): bold (no color)
@@ -69,96 +127,172 @@ def colorize_yaml(yaml_text: str) -> str:
     - Punctuation [] and {}: magenta
     - List marker '- ': cyan
     - Comments: blue
+    Lines are written to `out` (default stdout) in chunks of
+    _WRITE_CHUNK so a line-buffered TTY flushes once per chunk.
+    Always emits ANSI codes; callers check _COLOR_ON first.
     """
-    if not _COLOR_ON:
-        return yaml_text
-
-    comment_re = re.compile(r"^(\s*#.*)$")
-    kv_re = re.compile(r"^(\s*)([^:\n]+?)(:)(\s*)(.*)$")
-    dash_re = re.compile(r"^(\s*)-\s+(.*)$")
-
-    def color_value(v: str) -> str:
-        sv = v.strip()
-        # punctuation and nulls
-        if sv in ("[]", "{}"):
-            return fmt(v, MAGENTA)
-        if sv.lower() in ("~", "null", "nil", "none"):
-            return fmt(v, MAGENTA)
-        # booleans
-        if sv.lower() in ("true", "false", "yes", "no", "on", "off"):
-            return fmt(v, MAGENTA)
-        # numbers (int/float/scientific)
-        if re.fullmatch(r"[+-]?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?", sv):
-            return fmt(v, YELLOW)
-        # quoted strings
-        if (sv.startswith("'") and sv.endswith("'")) or (sv.startswith('"') and sv.endswith('"')):
-            return fmt(v, GREEN)
-        # unquoted scalars as strings
-        return fmt(v, GREEN)
-
-    out_lines = []
+    write = (out or sys.stdout).write
+    chunk = []
     for line in yaml_text.splitlines():
-        m = comment_re.match(line)
-        if m:
-            out_lines.append(fmt(m.group(1), BLUE))
-            continue
-
-        m = dash_re.match(line)
-        if m:
-            indent, val = m.groups()
-            out_lines.append(indent + fmt("- ", CYAN) + color_value(val))
-            continue
-
-        m = kv_re.match(line)
-        if m:
-            indent, key, colon, space, val = m.groups()
+        m = _LINE_RE.match(line)
+        g = m.lastgroup if m else None
+
+        if g == "comment":
+            line = f"{BLUE}{m.group('comment')}{RESET}"
+        elif g == "dval":
+            line = f"{m.group('dindent')}{_DASH}{_color_value(m.group('dval'))}"
+        elif g == "kval":
+            indent, key, colon, space, val = m.group(
+                "kindent", "key", "colon", "kspace", "kval")
+            colored_val = _color_value(val) if val else ""
             # Top-level keys have no indentation
-            if len(indent) == 0:
-                key_part = fmt(key, BOLD, MAGENTA)
+            if not indent:
+                line = f"{_S_BM}{key}{RESET}{colon}{space}{colored_val}"
             else:
-                key_part = fmt(key, BOLD)
-            out_lines.append(
-                indent + key_part + colon + space +
-                (color_value(val) if val else "")
-            )
-            continue
+                line = f"{indent}{BOLD}{key}{RESET}{colon}{space}{colored_val}"
+        chunk.append(line)
+        if len(chunk) >= _WRITE_CHUNK:
+            write("\n".join(chunk) + "\n")
+            chunk.clear()
+    if chunk:
+        write("\n".join(chunk) + "\n")
+
+
+def colorize_yaml(yaml_text: str) -> str:
+    """Return the colored YAML as a string (see write_colored_yaml)."""
+    buf = io.StringIO()
+    write_colored_yaml(yaml_text, buf)
+    return buf.getvalue()[:-1]
+
 
-        out_lines.append(line)
+# PyYAML is imported on first use; a fresh JSON cache avoids it entirely
+_yaml = None
+_Loader = _Dumper = None
 
-    return "\n".join(out_lines)
+
+def _get_yaml():
+    """Import yaml once and resolve the fastest safe Loader/Dumper."""
+    global _yaml, _Loader, _Dumper
+    if _yaml is None:
+        import yaml
+        try:
+            from yaml import CSafeLoader as _Loader, CSafeDumper as _Dumper
+        except ImportError:
+            from yaml import SafeLoader as _Loader, SafeDumper as _Dumper
+        _yaml = yaml
+    return _yaml
+
+
+def _dump_yaml(data, stream=None):
+    yaml = _get_yaml()
+    return yaml.dump(data, stream, Dumper=_Dumper, allow_unicode=True, sort_keys=False)
+
+
+def _load_cache(st):
+    """Return cached data if the snapshot matches ITEMS_FILE, else None."""
+    try:
+        with open(CACHE_FILE, "r", encoding="utf-8") as f:
+            cache = json.load(f)
+        if cache["mtime_ns"] == st.st_mtime_ns and cache["size"] == st.st_size:
+            return cache["data"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    return None
+
+
+def _write_cache(st, data):
+    tmp = CACHE_FILE + ".tmp"
+    try:
+        text = json.dumps({"mtime_ns": st.st_mtime_ns, "size": st.st_size,
+                           "data": data}, ensure_ascii=False)
+        # JSON stringifies non-str keys (1, no -> "1", "false"); only cache
+        # data that loads back identical to what YAML produced
+        if json.loads(text)["data"] != data:
+            return
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp, CACHE_FILE)
+    except (OSError, TypeError, ValueError):
+        # Cache is best-effort; YAML stays the source of truth
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+
+
+def _drop_cache():
+    try:
+        os.remove(CACHE_FILE)
+    except OSError:
+        pass
 
 
 def load_items():
-    if not os.path.exists(ITEMS_FILE):
+    try:
+        st = os.stat(ITEMS_FILE)
+    except FileNotFoundError:
         return {"categories": {}}
+    data = _load_cache(st)
+    if data is not None:
+        return data
+    yaml = _get_yaml()
     with open(ITEMS_FILE, "r", encoding="utf-8") as f:
-        return yaml.safe_load(f)
+        data = yaml.load(f, Loader=_Loader)
+    _write_cache(st, data)
+    return data
 
 
 def save_items(data):
-    with open(ITEMS_FILE, "w", encoding="utf-8") as f:
-        yaml.dump(data, f, allow_unicode=True, sort_keys=False)
+    # Write to a temp file and swap it in so an interrupted save can't
+    # leave a truncated pb.yaml behind. Replace the symlink target (not the
+    # link itself) and keep its permissions.
+    target = os.path.realpath(ITEMS_FILE)
+    tmp = target + ".tmp"
+    try:
+        with open(tmp, "w", encoding="utf-8") as f:
+            _dump_yaml(data, f)
+        if os.path.exists(target):
+            shutil.copymode(target, tmp)
+        os.replace(tmp, target)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+    _drop_cache()
+
+
+# Rendered category list, rebuilt only when the categories mapping changes
+_category_menu_cache = {"sig": None, "text": ""}
 
 
 def choose_category(data):
-    print(fmt("\nAvailable categories:", BOLD, CYAN))
-    for key, name in data["categories"].items():
-        print(f"  {fmt(key, BOLD, MAGENTA)} → {fmt(name, CYAN)}")
+    cache = _category_menu_cache
+    sig = tuple(data["categories"].items())
+    if sig != cache["sig"]:
+        cache["text"] = "\n".join(
+            [_bc("\nAvailable categories:")] +
+            [f"  {_bm(key)} → {fmt(name, CYAN)}" for key, name in sig]
+        )
+        cache["sig"] = sig
+    print(cache["text"])
     cat = input(
         "Choose category (key, or press Enter to cancel): ").strip().lower()
     return cat if cat in data["categories"] else None
 
 
 def add_item(data):
+    """Prompt for a new item; return True if one was added."""
     cat = choose_category(data)
     if not cat:
         print(fmt("No category chosen.", YELLOW))
-        return
+        return False
 
     item_name = input("Item name (e.g. laptop, toothbrush): ").strip().lower()
     if not item_name:
         print(fmt("Item name required.", RED))
-        return
+        return False
 
     details = input("Details (e.g. mb, ios) [Enter = none]: ").strip().lower()
     season = input(
@@ -180,22 +314,26 @@ def add_item(data):
     data[category_name].append(code)
 
     print(fmt(f"Added: {code}", GREEN))
+    return True
 
 
 def manage_categories(data):
     # Backward-compat wrapper; use the unified categories menu
-    categories_menu(data)
+    return categories_menu(data)
 
 
 def categories_menu(data):
-    print(fmt("\nCategories:", BOLD, CYAN))
-    print("1. Add category")
-    print("2. Delete category")
-    print("3. Modify category")
+    """Add, delete, or modify categories; return True if data changed."""
+    print("\n".join((
+        _bc("\nCategories:"),
+        "1. Add category",
+        "2. Delete category",
+        "3. Modify category",
+    )))
     choice = input("Choose option (Enter to cancel): ").strip()
 
     if choice == "":
-        return
+        return False
     if choice == "1":
         key = input("Category key (one letter): ").strip().lower()
         name = input("Category name: ").strip()
@@ -204,6 +342,7 @@ def categories_menu(data):
             if name not in data:
                 data[name] = []
             print(fmt(f"Category added: {key} → {name}", GREEN))
+            return True
         else:
             print(fmt("Key and name are required.", YELLOW))
     elif choice == "2":
@@ -212,33 +351,30 @@ def categories_menu(data):
             name = data["categories"].pop(key)
             data.pop(name, None)
             print(fmt(f"Category {key} → {name} deleted.", GREEN))
+            return True
         else:
             print(fmt("No category chosen.", YELLOW))
     elif choice == "3":
         old_key = choose_category(data)
         if not old_key:
             print(fmt("No category chosen.", YELLOW))
-            return
+            return False
         old_name = data["categories"][old_key]
-        print(fmt(f"\nModify category {old_key} → {old_name}", BOLD, CYAN))
+        print(_bc(f"\nModify category {old_key} → {old_name}"))
         new_key = input(f"New key (Enter to keep '{old_key}'): ").strip().lower() or old_key
         new_name = input(f"New name (Enter to keep '{old_name}'): ").strip() or old_name
 
         # Validate collisions
         if new_key != old_key and new_key in data["categories"]:
             print(fmt("A category with this key already exists.", RED))
-            return
+            return False
         if new_name != old_name and new_name in data and new_name not in (old_name,):
             print(fmt("A category with this name already exists.", RED))
-            return
+            return False
 
-        # Update name (list key) if changed
+        # Move items to the new list key if the name changed
         if new_name != old_name:
-            data.setdefault(new_name, data.get(old_name, []))
-            if old_name in data and new_name != old_name:
-                # Move items to new list key
-                items_list = data.pop(old_name)
-                data[new_name] = items_list
+            data[new_name] = data.pop(old_name, [])
 
         # Update key mapping
         if new_key != old_key or new_name != old_name:
@@ -248,56 +384,56 @@ def categories_menu(data):
 
         # If key changed, update all item codes under this category
         if new_key != old_key:
-            items = data.get(new_name, [])
-            updated = []
-            for code in items:
-                parts = code.split("-", 1)
-                if parts:
-                    if len(parts) == 1:
-                        updated.append(new_key)
-                    else:
-                        updated.append(new_key + "-" + parts[1])
-                else:
-                    updated.append(code)
-            data[new_name] = updated
+            # partition() always yields (prefix, sep, rest); sep is "" if no dash
+            data[new_name] = [
+                new_key + sep + rest
+                for _, sep, rest in (code.partition("-") for code in data.get(new_name, []))
+            ]
         print(fmt("Category modified.", GREEN))
+        return new_key != old_key or new_name != old_name
     else:
         print(fmt("Invalid choice.", YELLOW))
+    return False
 
 
 def manage_items(data):
-    """Edit, move, or delete existing items."""
+    """Edit, move, or delete existing items; return True if data changed."""
     # Pick a category first
     cat_key = choose_category(data)
     if not cat_key:
         print(fmt("No category chosen.", YELLOW))
-        return
+        return False
 
     cat_name = data["categories"][cat_key]
     items = data.get(cat_name, [])
 
     if not items:
         print(fmt(f"No items in '{cat_name}'.", YELLOW))
-        return
+        return False
 
-    print(fmt(f"\nItems in {cat_name}:", BOLD, CYAN))
-    for i, code in enumerate(items, 1):
-        print(f"  {i}. {fmt(code, GREEN)}")
+    print(_bc(f"\nItems in {cat_name}:"))
+    print("\n".join(f"  {i}. {fmt(code, GREEN)}" for i, code in enumerate(items, 1)))
 
     sel = input("Choose item number to modify (Enter to cancel): ").strip()
     if not sel:
-        return
-    if not sel.isdigit() or not (1 <= int(sel) <= len(items)):
+        return False
+    try:
+        idx = int(sel) - 1
+    except ValueError:
+        print(fmt("Invalid selection.", YELLOW))
+        return False
+    if not 0 <= idx < len(items):
         print(fmt("Invalid selection.", YELLOW))
-        return
+        return False
 
-    idx = int(sel) - 1
     code = items[idx]
 
-    print(fmt(f"\nModify item: {code}", BOLD, CYAN))
-    print("1. Edit code")
-    print("2. Move to another category")
-    print("3. Delete item")
+    print("\n".join((
+        _bc(f"\nModify item: {code}"),
+        "1. Edit code",
+        "2. Move to another category",
+        "3. Delete item",
+    )))
     action = input("Choose action: ").strip()
 
     if action == "1":
@@ -305,17 +441,18 @@ def manage_items(data):
         if new_code:
             items[idx] = new_code
             print(fmt("Item updated.", GREEN))
+            return True
         else:
             print(fmt("No changes made.", YELLOW))
     elif action == "2":
         new_cat_key = choose_category(data)
         if not new_cat_key:
             print(fmt("No category chosen.", YELLOW))
-            return
+            return False
         new_cat_name = data["categories"][new_cat_key]
         if new_cat_name == cat_name:
             print(fmt("Item already in this category.", YELLOW))
-            return
+            return False
         # Move item list-wise and update code prefix to new category key
         parts = code.split("-")
         if parts:
@@ -326,27 +463,33 @@ def manage_items(data):
         # Add to new list
         data.setdefault(new_cat_name, []).append(new_code)
         print(fmt(f"Moved to {new_cat_name} as {new_code}.", GREEN))
+        return True
     elif action == "3":
         items.pop(idx)
         print(fmt("Item deleted.", GREEN))
+        return True
     else:
         print(fmt("Unknown action.", YELLOW))
+    return False
 
 
 def items_menu(data):
-    """Unified items entry: add new items or manage existing ones."""
-    print(fmt("\nItems:", BOLD, CYAN))
-    print("1. Add item")
-    print("2. Manage existing items")
+    """Unified items entry: add new items or manage existing ones.
+    Returns True if data changed."""
+    print("\n".join((
+        _bc("\nItems:"),
+        "1. Add item",
+        "2. Manage existing items",
+    )))
     choice = input("Choose option (Enter to cancel): ").strip()
     if choice == "":
-        return
+        return False
     if choice == "1":
-        add_item(data)
-    elif choice == "2":
-        manage_items(data)
-    else:
-        print(fmt("Invalid choice.", YELLOW))
+        return add_item(data)
+    if choice == "2":
+        return manage_items(data)
+    print(fmt("Invalid choice.", YELLOW))
+    return False
 
 
 def main():
@@ -355,11 +498,13 @@ def main():
         data["categories"] = {}
 
     while True:
-        print(fmt("=== personal-belongings manager ===", BOLD, CYAN))
-        print("1. Items")
-        print("2. Categories")
-        print("3. Show items")
-        print("4. Exit")
+        print("\n".join((
+            _bc("=== personal-belongings manager ==="),
+            "1. Items",
+            "2. Categories",
+            "3. Show items",
+            "4. Exit",
+        )))
         choice = input("Choose option: ").strip()
 
         # Enter in main menu => exit
@@ -367,16 +512,19 @@ def main():
             break
 
         if choice == "1":
-            items_menu(data)
-            save_items(data)
+            if items_menu(data):
+                save_items(data)
         elif choice == "2":
-            categories_menu(data)
-            save_items(data)
+            if categories_menu(data):
+                save_items(data)
         elif choice == "3":
             clear_screen()
-            print(fmt("=== items (yaml) ===", BOLD, CYAN))
-            text = yaml.dump(data, allow_unicode=True, sort_keys=False)
-            print(colorize_yaml(text))
+            print(_bc("=== items (yaml) ==="))
+            text = _dump_yaml(data)
+            if _COLOR_ON:
+                write_colored_yaml(text)
+            else:
+                print(text)
             wait_for_enter()
         elif choice == "4":
             break